@@ -25,6 +25,28 @@ import type { PluginContext } from "../plugins/types.js";
 import type { BotAdapter } from "./types.js";
 import { log } from "../core/logger.js";
 
+/**
+ * The user-settable parts of a command definition, in a form that compares
+ * equal between our builder output and what Discord returns (which adds ids,
+ * versions and defaulted fields).
+ */
+function commandShape(def: unknown): unknown {
+  const d = (def ?? {}) as Record<string, unknown>;
+  return {
+    type: d.type ?? 1,
+    name: d.name,
+    description: d.description,
+    required: d.required ?? false,
+    choices: d.choices ?? [],
+    options: Array.isArray(d.options) ? d.options.map(commandShape) : [],
+  };
+}
+
+/** Order-independent fingerprint of a command set. */
+function commandsSignature(defs: unknown[]): string {
+  return JSON.stringify(defs.map(commandShape).map((c) => JSON.stringify(c)).sort());
+}
+
 export class DiscordAdapter implements BotAdapter {
   private readonly client: Client;
   private readonly platform: DiscordPlatform;
@@ -105,11 +127,26 @@ export class DiscordAdapter implements BotAdapter {
 
   // -- Register slash commands on startup --
 
+  /**
+   * Commands are only PUT when the set registered with Discord differs from
+   * ours. Comparing against Discord itself (one GET) also catches commands
+   * changed from another checkout or deleted in the developer portal.
+   */
   private async registerCommands(): Promise<void> {
+    const body = this.buildSlashCommandsJSON();
+    const route = Routes.applicationCommands(this.config.discordAppId!);
     const rest = new REST({ version: "10" }).setToken(this.config.discordToken!);
-    await rest.put(Routes.applicationCommands(this.config.discordAppId!), {
-      body: this.buildSlashCommandsJSON(),
+
+    const registered = await rest.get(route).catch((err: unknown) => {
+      log.warn("bot", `Failed to fetch slash commands: ${err instanceof Error ? err.message : String(err)}`);
+      return undefined;
     });
+    if (Array.isArray(registered) && commandsSignature(registered) === commandsSignature(body)) {
+      log.info("bot", "Slash commands unchanged, skipping registration");
+      return;
+    }
+
+    await rest.put(route, { body });
     log.info("bot", "Slash commands registered");
   }
 
@@ -171,9 +208,11 @@ export class DiscordAdapter implements BotAdapter {
     // Follow-up messages in active conversations
     this.client.on("messageCreate", async (message: Message) => {
       if (message.author.bot) return;
-      if (!this.isUserAllowed(message.author.id)) return;
+      // Most channel traffic has no active conversation — reject on that first.
+      // The allowlist is re-checked after so revoked users are cut off mid-session.
       const convo = this.conversations.get(message.author.id, message.channelId);
       if (!convo) return;
+      if (!this.isUserAllowed(message.author.id)) return;
 
       const busyKey = `${message.author.id}:${message.channelId}`;
       if (this.busy.has(busyKey)) {
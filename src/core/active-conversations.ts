@@ -15,12 +15,25 @@ export interface Conversation {
   startedAt: number;
 }
 
-type ConvoKey = string;
-
-function makeKey(userId: string, channelId: string): ConvoKey {
+/** Flat `userId:channelId` key — only used for the persisted file format. */
+function makeKey(userId: string, channelId: string): string {
   return `${userId}:${channelId}`;
 }
 
+/**
+ * Split a persisted key from files written before entries carried their own
+ * userId/channelId. Web sessions use the same `web:<session>` string for both
+ * halves, so a key with two identical halves is split down the middle.
+ */
+function parseLegacyKey(key: string): [string, string] {
+  const mid = (key.length - 1) / 2;
+  if (key[mid] === ":" && key.slice(0, mid) === key.slice(mid + 1)) {
+    return [key.slice(0, mid), key.slice(mid + 1)];
+  }
+  const idx = key.indexOf(":");
+  return [key.slice(0, idx), key.slice(idx + 1)];
+}
+
 export function resolveWorkdir(workdir: string, baseDir: string): string {
   if (isAbsolute(workdir)) return resolve(workdir);
   return resolve(baseDir, workdir);
@@ -42,7 +55,8 @@ export function validateWorkdir(resolved: string): void {
 }
 
 export class ActiveConversations {
-  private readonly convos = new Map<ConvoKey, Conversation>();
+  /** userId → channelId → conversation. Nested so lookups never build a composite key. */
+  private readonly convos = new Map<string, Map<string, Conversation>>();
   private readonly persistPath: string | undefined;
   private readonly baseDir: string;
 
@@ -101,7 +115,11 @@ export class ActiveConversations {
         startedAt: entry.startedAt as number,
       };
       if (typeof entry.sessionId === "string") convo.sessionId = entry.sessionId;
-      this.convos.set(key, convo);
+      const [userId, channelId] =
+        typeof entry.userId === "string" && typeof entry.channelId === "string"
+          ? [entry.userId as string, entry.channelId as string]
+          : parseLegacyKey(key);
+      this.put(userId, channelId, convo);
       loaded++;
     }
 
@@ -115,9 +133,11 @@ export class ActiveConversations {
   private save(): void {
     if (!this.persistPath) return;
 
-    const data: Record<string, Conversation> = {};
-    for (const [key, convo] of this.convos) {
-      data[key] = convo;
+    const data: Record<string, Conversation & { userId: string; channelId: string }> = {};
+    for (const [userId, channels] of this.convos) {
+      for (const [channelId, convo] of channels) {
+        data[makeKey(userId, channelId)] = { ...convo, userId, channelId };
+      }
     }
 
     try {
@@ -128,6 +148,28 @@ export class ActiveConversations {
     }
   }
 
+  // -- Storage helpers ----------------------------------------------------
+
+  private lookup(userId: string, channelId: string): Conversation | undefined {
+    return this.convos.get(userId)?.get(channelId);
+  }
+
+  private put(userId: string, channelId: string, convo: Conversation): void {
+    let channels = this.convos.get(userId);
+    if (!channels) {
+      channels = new Map();
+      this.convos.set(userId, channels);
+    }
+    channels.set(channelId, convo);
+  }
+
+  private remove(userId: string, channelId: string): boolean {
+    const channels = this.convos.get(userId);
+    if (!channels?.delete(channelId)) return false;
+    if (channels.size === 0) this.convos.delete(userId);
+    return true;
+  }
+
   // -- Mutation methods ---------------------------------------------------
 
   start(
@@ -136,8 +178,7 @@ export class ActiveConversations {
     pluginId: string,
     workdir: string,
   ): Conversation {
-    const key = makeKey(userId, channelId);
-    const existing = this.convos.get(key);
+    const existing = this.lookup(userId, channelId);
     if (existing) {
       throw new Error(
         `Already in a ${existing.pluginId} conversation. Use /end or /clear first.`,
@@ -150,18 +191,18 @@ export class ActiveConversations {
       workdir: resolved,
       startedAt: Date.now(),
     };
-    this.convos.set(key, convo);
+    this.put(userId, channelId, convo);
     this.save();
     log.info("convo", `start user=${userId} channel=${channelId} plugin=${pluginId} workdir=${resolved}`);
     return convo;
   }
 
   get(userId: string, channelId: string): Conversation | undefined {
-    return this.convos.get(makeKey(userId, channelId));
+    return this.lookup(userId, channelId);
   }
 
   updateSessionId(userId: string, channelId: string, sessionId: string): void {
-    const convo = this.convos.get(makeKey(userId, channelId));
+    const convo = this.lookup(userId, channelId);
     if (convo) {
       convo.sessionId = sessionId;
       this.save();
@@ -170,7 +211,7 @@ export class ActiveConversations {
   }
 
   end(userId: string, channelId: string): boolean {
-    const deleted = this.convos.delete(makeKey(userId, channelId));
+    const deleted = this.remove(userId, channelId);
     if (deleted) {
       this.save();
       log.info("convo", `end user=${userId} channel=${channelId}`);
@@ -180,23 +221,24 @@ export class ActiveConversations {
 
   /** End the current conversation and immediately start a fresh one with the same plugin/workdir. */
   clear(userId: string, channelId: string): Conversation | undefined {
-    const key = makeKey(userId, channelId);
-    const existing = this.convos.get(key);
+    const existing = this.lookup(userId, channelId);
     if (!existing) return undefined;
     const { pluginId, workdir } = existing;
-    this.convos.delete(key);
     const convo: Conversation = { pluginId, workdir, startedAt: Date.now() };
-    this.convos.set(key, convo);
+    this.put(userId, channelId, convo);
     this.save();
     log.info("convo", `clear user=${userId} channel=${channelId} plugin=${pluginId}`);
     return convo;
   }
 
   listAll(): Array<{ userId: string; channelId: string; conversation: Conversation }> {
-    return [...this.convos.entries()].map(([key, conversation]) => {
-      const [userId, channelId] = key.split(":");
-      return { userId, channelId, conversation };
-    });
+    const all: Array<{ userId: string; channelId: string; conversation: Conversation }> = [];
+    for (const [userId, channels] of this.convos) {
+      for (const [channelId, conversation] of channels) {
+        all.push({ userId, channelId, conversation });
+      }
+    }
+    return all;
   }
 
   /**
@@ -212,9 +254,8 @@ export class ActiveConversations {
   ): Conversation {
     const resolved = resolveWorkdir(workdir, this.baseDir);
     validateWorkdir(resolved); // throws before any mutation
-    const key = makeKey(userId, channelId);
     const convo: Conversation = { pluginId, workdir: resolved, startedAt: Date.now() };
-    this.convos.set(key, convo);
+    this.put(userId, channelId, convo);
     this.save();
     log.info("convo", `replace user=${userId} channel=${channelId} plugin=${pluginId} workdir=${resolved}`);
     return convo;
@@ -230,14 +271,13 @@ export class ActiveConversations {
   ): Conversation {
     const resolved = resolveWorkdir(workdir, this.baseDir);
     validateWorkdir(resolved);
-    const key = makeKey(userId, channelId);
     const convo: Conversation = {
       pluginId,
       workdir: resolved,
       sessionId,
       startedAt: Date.now(),
     };
-    this.convos.set(key, convo);
+    this.put(userId, channelId, convo);
     this.save();
     log.info("convo", `resume user=${userId} channel=${channelId} plugin=${pluginId} session=${sessionId}`);
     return convo;
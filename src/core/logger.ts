@@ -56,7 +56,9 @@ export function logBotEvent(ev: BotEvent, lens: OpenBlockLens): void {
       break;
     }
     case "block_emit":
-      if (ev.block.kind === "tool_use") {
+      if (ev.block.kind === "text") {
+        log.info(STREAM, `[${p}] text id=${ev.block.id} (${ev.block.text.length} chars)`);
+      } else if (ev.block.kind === "tool_use") {
         const input = truncate(JSON.stringify(ev.block.input), 120);
         log.info(STREAM, `[${p}] tool_use ${ev.block.toolName} ${input}`);
       } else if (ev.block.kind === "tool_result") {
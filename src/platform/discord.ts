@@ -8,6 +8,7 @@ export class DiscordPlatform implements ChatPlatform {
     supportsEdit: true,
     editRateLimitMs: 500,
     supportsThreads: true,
+    sendClearsTyping: true,
   };
 
   constructor(private readonly client: Client) {}
@@ -10,6 +10,7 @@ export class TelegramPlatform implements ChatPlatform {
     supportsEdit: true,
     editRateLimitMs: 1000,
     supportsThreads: false,
+    sendClearsTyping: false,
   };
 
   async send(_channelId: string, _msg: OutboundMessage): Promise<MessageRef> {
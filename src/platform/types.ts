@@ -7,6 +7,8 @@ export interface PlatformConstraints {
   editRateLimitMs: number;
   /** Can we create threads / replies? */
   supportsThreads: boolean;
+  /** Does sending a message clear the typing indicator by itself? */
+  sendClearsTyping: boolean;
 }
 
 export interface MessageRef {
@@ -83,6 +83,7 @@ export class WebPlatform implements ChatPlatform {
     supportsEdit: true,
     editRateLimitMs: 50,
     supportsThreads: false,
+    sendClearsTyping: false,
   };
 
   private readonly channels = new Map<string, EventBuffer>();
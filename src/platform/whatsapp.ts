@@ -10,6 +10,7 @@ export class WhatsAppPlatform implements ChatPlatform {
     supportsEdit: false,
     editRateLimitMs: 0,
     supportsThreads: false,
+    sendClearsTyping: false,
   };
 
   async send(_channelId: string, _msg: OutboundMessage): Promise<MessageRef> {
@@ -53,62 +53,69 @@ export function createClaudeMapper(pluginId: "claude") {
     const content = extractContent(msg);
     if (content) {
       for (const block of content) {
-        if (block.type === "text") {
-          const id = nextId();
-          yield { type: "block_open", pluginId, ts, block: { id, kind: "text" } };
-          yield { type: "block_delta", pluginId, ts, blockId: id, delta: (block as TextBlock).text };
-          yield { type: "block_close", pluginId, ts, blockId: id };
-        }
+        // One dispatch on the discriminant; each case sees the narrowed block type.
+        switch (block.type) {
+          case "text":
+            // Text arrives complete (non-streaming SDK mode) — one emit, not open/delta/close.
+            yield {
+              type: "block_emit",
+              pluginId,
+              ts,
+              block: { id: nextId(), kind: "text", text: block.text },
+            };
+            break;
 
-        if (block.type === "thinking") {
-          const id = nextId();
-          yield { type: "block_open", pluginId, ts, block: { id, kind: "thinking" } };
-          yield {
-            type: "block_delta",
-            pluginId,
-            ts,
-            blockId: id,
-            delta: (block as ThinkingBlock).thinking,
-          };
-          yield { type: "block_close", pluginId, ts, blockId: id };
-        }
+          case "thinking": {
+            const id = nextId();
+            yield { type: "block_open", pluginId, ts, block: { id, kind: "thinking" } };
+            yield {
+              type: "block_delta",
+              pluginId,
+              ts,
+              blockId: id,
+              delta: block.thinking,
+            };
+            yield { type: "block_close", pluginId, ts, blockId: id };
+            break;
+          }
 
-        if (block.type === "tool_use") {
-          const tu = block as ToolUseBlock;
-          const mapped = mapSpecialTool(tu, pluginId, ts, nextId);
-          if (mapped) {
-            for (const ev of mapped) yield ev;
-          } else {
+          case "tool_use": {
+            const mapped = mapSpecialTool(block, pluginId, ts, nextId);
+            if (mapped) {
+              for (const ev of mapped) yield ev;
+            } else {
+              yield {
+                type: "block_emit",
+                pluginId,
+                ts,
+                block: {
+                  id: nextId(),
+                  kind: "tool_use",
+                  toolName: cleanToolName(block.name),
+                  toolId: block.id,
+                  input: block.input,
+                },
+              };
+            }
+            break;
+          }
+
+          case "tool_result": {
             yield {
               type: "block_emit",
               pluginId,
               ts,
               block: {
                 id: nextId(),
-                kind: "tool_use",
-                toolName: cleanToolName(tu.name),
-                toolId: tu.id,
-                input: tu.input,
+                kind: "tool_result",
+                toolUseId: block.tool_use_id,
+                isError: block.is_error ?? false,
+                content: normalizeToolResultContent(block.content),
               },
             };
+            break;
           }
         }
-
-        if (block.type === "tool_result") {
-          const tr = block as ToolResultBlock;
-          yield {
-            type: "block_emit",
-            pluginId,
-            ts,
-            block: {
-              id: nextId(),
-              kind: "tool_result",
-              toolUseId: tr.tool_use_id,
-              isError: tr.is_error ?? false,
-              content: normalizeToolResultContent(tr.content),
-            },
-          };
-        }
       }
     }
 
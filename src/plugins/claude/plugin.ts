@@ -8,6 +8,14 @@ export class ClaudePlugin implements CliPlugin {
   readonly id = "claude";
   readonly displayName = "Claude Code";
 
+  /** Options that never change between calls; built once. */
+  private readonly baseOptions = {
+    permissionMode: "bypassPermissions" as const,
+    maxTurns: this.maxTurns,
+    maxBudgetUsd: this.maxBudgetUsd,
+    settingSources: ["user", "project", "local"] as ("user" | "project" | "local")[],
+  };
+
   constructor(
     private readonly maxTurns = 30,
     private readonly maxBudgetUsd = 5.0,
@@ -24,11 +32,8 @@ export class ClaudePlugin implements CliPlugin {
       : undefined;
 
     const options = {
-      permissionMode: "bypassPermissions" as const,
-      maxTurns: this.maxTurns,
-      maxBudgetUsd: this.maxBudgetUsd,
+      ...this.baseOptions,
       cwd: input.workdir,
-      settingSources: ["user", "project", "local"] as ("user" | "project" | "local")[],
       resume: input.sessionId,
       mcpServers,
     };
@@ -1,6 +1,8 @@
 import type { BotEvent } from "../../stream/events.js";
 import { cleanToolName } from "../util.js";
 
+const NON_BLANK_RE = /\S/;
+
 export class GeminiEventParser {
   private blockSeq = 0;
   private textBlockId: string | null = null;
@@ -26,8 +28,29 @@ export class GeminiEventParser {
     return [ev];
   }
 
+  /**
+   * Parse lines that arrived together. Consecutive deltas for the same text
+   * block are merged, so a burst costs the consumer one re-render, not one
+   * per line. Nothing is held back waiting for more input.
+   */
+  pushLines(lines: string[]): BotEvent[] {
+    const out: BotEvent[] = [];
+    for (const line of lines) {
+      for (const ev of this.pushLine(line)) {
+        const prev = out[out.length - 1];
+        if (ev.type === "block_delta" && prev?.type === "block_delta" && prev.blockId === ev.blockId) {
+          out[out.length - 1] = { ...prev, delta: prev.delta + ev.delta };
+        } else {
+          out.push(ev);
+        }
+      }
+    }
+    return out;
+  }
+
   pushLine(line: string): BotEvent[] {
-    if (!line.trim()) return [];
+    // JSON.parse tolerates surrounding whitespace; only test for blank lines.
+    if (!NON_BLANK_RE.test(line)) return [];
 
     let parsed: Record<string, unknown>;
     try {
@@ -121,7 +144,7 @@ export class GeminiEventParser {
     return events;
   }
 
-  *finish(exitCode: number | null): Generator<BotEvent> {
+  *finish(exitCode: number | null, stderr = ""): Generator<BotEvent> {
     yield* this.closeTextBlock();
     // If no result event was emitted, the caller checks whether
     // a CompleteEvent was already yielded.
@@ -130,7 +153,11 @@ export class GeminiEventParser {
         type: "fatal_error",
         pluginId: "gemini",
         ts: Date.now(),
-        error: { message: `Gemini CLI exited with code ${exitCode}` },
+        error: {
+          message: stderr.trim()
+            ? `Gemini CLI exited with code ${exitCode}: ${stderr.trim()}`
+            : `Gemini CLI exited with code ${exitCode}`,
+        },
       };
     }
   }
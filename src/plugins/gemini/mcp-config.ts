@@ -1,4 +1,4 @@
-import { writeFile, readFile, unlink, mkdir } from "node:fs/promises";
+import { writeFile, readFile, unlink, mkdir, stat } from "node:fs/promises";
 import { join } from "node:path";
 import { findGitRoot } from "../../util/git.js";
 import type { PluginContext } from "../types.js";
@@ -17,12 +17,30 @@ export interface LaunchConfig {
  */
 interface ConfigLease {
   refCount: number;
-  originalSettings: string | null;
+  /** Raw bytes, so the restore is byte-for-byte with no re-encode. */
+  originalSettings: Buffer | null;
   existed: boolean;
+  injected: string;
+  endpoints: PluginContext["mcpEndpoints"];
 }
 
 const activeLeases = new Map<string, ConfigLease>();
 
+/**
+ * What each settings file looked like right after we last restored it, with
+ * the injected text derived from it. If size and mtime still match on the
+ * next turn the file is untouched, so the read/parse/stringify is skipped.
+ */
+interface RestoredSettings {
+  mtimeMs: number;
+  size: number;
+  originalSettings: Buffer;
+  injected: string;
+  endpoints: PluginContext["mcpEndpoints"];
+}
+
+const restoredSettings = new Map<string, RestoredSettings>();
+
 export async function prepareGeminiLaunch(opts: {
   workdir: string;
   sessionId?: string;
@@ -40,24 +58,45 @@ export async function prepareGeminiLaunch(opts: {
     // just bump the ref count instead of re-reading/re-writing.
     existingLease.refCount++;
   } else {
-    let originalSettings: string | null = null;
+    let originalSettings: Buffer | null = null;
     let existed = false;
+    let injected: string;
 
-    try {
-      originalSettings = await readFile(settingsPath, "utf-8");
+    const known = restoredSettings.get(settingsPath);
+    const st = known && (await stat(settingsPath).catch(() => undefined));
+    if (
+      known && st &&
+      known.endpoints === opts.mcpEndpoints &&
+      st.mtimeMs === known.mtimeMs &&
+      st.size === known.size
+    ) {
+      originalSettings = known.originalSettings;
       existed = true;
-    } catch {
-      await mkdir(join(gitRoot, ".gemini"), { recursive: true });
-    }
+      injected = known.injected;
+    } else {
+      try {
+        originalSettings = await readFile(settingsPath);
+        existed = true;
+      } catch {
+        await mkdir(join(gitRoot, ".gemini"), { recursive: true });
+      }
 
-    const settings = existed ? JSON.parse(originalSettings!) : {};
-    settings.mcpServers ??= {};
-    for (const ep of opts.mcpEndpoints) {
-      settings.mcpServers[ep.name] = { url: ep.url, type: "http", trust: true };
+      const settings = existed ? JSON.parse(originalSettings!.toString("utf-8")) : {};
+      settings.mcpServers ??= {};
+      for (const ep of opts.mcpEndpoints) {
+        settings.mcpServers[ep.name] = { url: ep.url, type: "http", trust: true };
+      }
+      injected = JSON.stringify(settings, null, 2) + "\n";
     }
-    await writeFile(settingsPath, JSON.stringify(settings, null, 2) + "\n");
+    await writeFile(settingsPath, injected);
 
-    activeLeases.set(settingsPath, { refCount: 1, originalSettings, existed });
+    activeLeases.set(settingsPath, {
+      refCount: 1,
+      originalSettings,
+      existed,
+      injected,
+      endpoints: opts.mcpEndpoints,
+    });
   }
 
   const cleanup = async () => {
@@ -72,6 +111,14 @@ export async function prepareGeminiLaunch(opts: {
     try {
       if (lease.existed && lease.originalSettings !== null) {
         await writeFile(settingsPath, lease.originalSettings);
+        const st = await stat(settingsPath);
+        restoredSettings.set(settingsPath, {
+          mtimeMs: st.mtimeMs,
+          size: st.size,
+          originalSettings: lease.originalSettings,
+          injected: lease.injected,
+          endpoints: lease.endpoints,
+        });
       } else if (!lease.existed) {
         await unlink(settingsPath).catch(() => {});
       }
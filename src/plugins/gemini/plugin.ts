@@ -1,11 +1,13 @@
 import { spawn } from "node:child_process";
-import { createInterface } from "node:readline";
 import type { CliPlugin, ExecuteInput, PluginContext, ConversationInfo } from "../types.js";
 import type { BotEvent } from "../../stream/events.js";
 import { GeminiEventParser } from "./event-parser.js";
 import { prepareGeminiLaunch } from "./mcp-config.js";
 import { log } from "../../core/logger.js";
 
+/** How much trailing stderr is kept for the error message on a failed run. */
+const STDERR_TAIL_CHARS = 4096;
+
 export class GeminiPlugin implements CliPlugin {
   readonly id = "gemini";
   readonly displayName = "Gemini";
@@ -33,18 +35,37 @@ export class GeminiPlugin implements CliPlugin {
 
     const parser = new GeminiEventParser(input.sessionId);
 
-    try {
-      const rl = createInterface({ input: child.stdout! });
+    // Drain stderr while stdout streams: an unread pipe fills up (~64 KB)
+    // and blocks the CLI mid-turn. Only the tail is kept, for error reports.
+    let stderrTail = "";
+    child.stderr!.setEncoding("utf-8");
+    child.stderr!.on("data", (chunk: string) => {
+      stderrTail = (stderrTail + chunk).slice(-STDERR_TAIL_CHARS);
+    });
 
-      for await (const line of rl) {
-        const events = parser.pushLine(line);
-        for (const ev of events) yield ev;
+    try {
+      // Read stdout in raw chunks rather than line by line: every complete
+      // line in a chunk is parsed together so bursts of deltas get merged.
+      child.stdout!.setEncoding("utf-8");
+      let pending = "";
+      for await (const chunk of child.stdout! as AsyncIterable<string>) {
+        const nl = chunk.lastIndexOf("\n");
+        if (nl < 0) {
+          pending += chunk;
+          continue;
+        }
+        const lines = (pending + chunk.slice(0, nl)).split("\n");
+        pending = chunk.slice(nl + 1);
+        for (const ev of parser.pushLines(lines)) yield ev;
+      }
+      if (pending) {
+        for (const ev of parser.pushLine(pending)) yield ev;
       }
 
       const code = await new Promise<number | null>((resolve) =>
         child.once("close", resolve),
       );
-      yield* parser.finish(code ?? 1);
+      yield* parser.finish(code ?? 1, stderrTail);
     } finally {
       // Kill the child process if it's still running (e.g. generator aborted
       // early because the user sent another command). Without this, orphaned
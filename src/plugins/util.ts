@@ -1,3 +1,10 @@
+/** Tool names repeat constantly within a turn, so cleaned names are memoized. */
+const TOOL_NAME_CACHE_MAX = 256;
+const toolNameCache = new Map<string, string>();
+
+/** A word start: the string start or a `-`/`_` separator, plus the letter after it. */
+const WORD_START_RE = /([-_]|^)([^-_]?)/g;
+
 /**
  * Clean up MCP-prefixed tool names into human-readable form.
  *
@@ -5,16 +12,22 @@
  * "Read"                                → "Read"
  */
 export function cleanToolName(raw: string): string {
-  if (raw.startsWith("mcp__")) {
-    const parts = raw.slice(5).split("__");
-    return parts
-      .map((p) =>
-        p
-          .split(/[-_]/)
-          .map((w) => w.charAt(0).toUpperCase() + w.slice(1))
-          .join(" "),
-      )
-      .join(" \u00B7 ");
+  if (!raw.startsWith("mcp__")) return raw;
+
+  const cached = toolNameCache.get(raw);
+  if (cached !== undefined) return cached;
+
+  const cleaned = raw
+    .slice(5)
+    .split("__")
+    .map((p) =>
+      p.replace(WORD_START_RE, (_m, sep: string, c: string) => (sep ? " " : "") + c.toUpperCase()),
+    )
+    .join(" \u00B7 ");
+
+  if (toolNameCache.size >= TOOL_NAME_CACHE_MAX) {
+    toolNameCache.delete(toolNameCache.keys().next().value!);
   }
-  return raw;
+  toolNameCache.set(raw, cleaned);
+  return cleaned;
 }
@@ -1,7 +1,12 @@
-import { spawn } from "node:child_process";
+import { spawn, type ChildProcess } from "node:child_process";
 import { setTimeout as sleep } from "node:timers/promises";
 import { RingBuffer, type ManagedProcess } from "./types.js";
 
+/** How long a process group gets after SIGTERM before SIGKILL. */
+const STOP_GRACE_MS = 10_000;
+/** How often the group is checked once the leader has exited. */
+const GROUP_POLL_MS = 100;
+
 export class ProcessSupervisor {
   private readonly processes = new Map<string, ManagedProcess>();
 
@@ -34,7 +39,8 @@ export class ProcessSupervisor {
 
     const child = spawn(input.command, managed.args, {
       cwd: managed.cwd,
-      env: { ...process.env, ...managed.env },
+      // No extra vars: let the child inherit process.env without a copy.
+      env: managed.env ? { ...process.env, ...managed.env } : undefined,
       stdio: ["ignore", "pipe", "pipe"],
       detached: process.platform !== "win32",
       shell: process.platform === "win32",
@@ -45,13 +51,11 @@ export class ProcessSupervisor {
     managed.status = "running";
 
     child.stdout.on("data", (buf: Buffer) => {
-      const str = buf.toString();
-      managed.stdout.append(str);
+      managed.stdout.append(buf);
       if (managed.pipeOutput) process.stdout.write(buf);
     });
     child.stderr.on("data", (buf: Buffer) => {
-      const str = buf.toString();
-      managed.stderr.append(str);
+      managed.stderr.append(buf);
       if (managed.pipeOutput) process.stderr.write(buf);
     });
     child.on("exit", (code) => {
@@ -87,13 +91,18 @@ export class ProcessSupervisor {
       }
 
       if (!force) {
-        await sleep(10_000);
-        if (!p.child.killed) {
-          try {
-            process.kill(-pid, "SIGKILL");
-          } catch {
-            /* already dead */
-          }
+        // The whole group gets the grace period: a wrapper (npm, sh -c) can
+        // exit before the server it launched finishes shutting down. Return
+        // early only once every member is gone.
+        const deadline = Date.now() + STOP_GRACE_MS;
+        await waitForExit(p.child, STOP_GRACE_MS);
+        while (groupAlive(pid) && Date.now() < deadline) {
+          await sleep(GROUP_POLL_MS);
+        }
+        try {
+          process.kill(-pid, "SIGKILL");
+        } catch {
+          /* already dead */
         }
       }
     }
@@ -121,7 +130,35 @@ export class ProcessSupervisor {
   }
 
   async stopAll(): Promise<void> {
-    const names = [...this.processes.keys()];
-    await Promise.allSettled(names.map((n) => this.stop(n)));
+    // "stopping" stays in: a graceful stop() may still be waiting to
+    // escalate, and the caller exits as soon as this returns.
+    const live = this.list().filter((p) => p.status !== "stopped" && p.status !== "failed");
+    await Promise.allSettled(live.map((p) => this.stop(p.name)));
+  }
+}
+
+/** True while any process in group `pgid` is still alive. */
+function groupAlive(pgid: number): boolean {
+  try {
+    process.kill(-pgid, 0);
+    return true;
+  } catch (err) {
+    return (err as NodeJS.ErrnoException).code === "EPERM";
   }
 }
+
+/** Resolves true once `child` has exited, or false after `ms`. */
+function waitForExit(child: ChildProcess, ms: number): Promise<boolean> {
+  if (child.exitCode !== null || child.signalCode !== null) return Promise.resolve(true);
+  return new Promise((resolve) => {
+    const onExit = () => {
+      clearTimeout(timer);
+      resolve(true);
+    };
+    const timer = setTimeout(() => {
+      child.off("exit", onExit);
+      resolve(false);
+    }, ms);
+    child.once("exit", onExit);
+  });
+}
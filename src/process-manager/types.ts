@@ -25,41 +25,64 @@ export interface ManagedProcess {
   child?: ChildProcess;
 }
 
+/**
+ * Fixed-size circular byte buffer for process output. Raw chunks are copied
+ * in as they arrive (no per-chunk objects, no eviction loop) and decoded
+ * only when read.
+ */
 export class RingBuffer {
-  private chunks: string[] = [];
-  private chars = 0;
+  private readonly buf: Buffer;
+  /** Next write offset. */
+  private head = 0;
+  /** Bytes currently held (≤ maxBytes). */
+  private filled = 0;
   private _seq = 0;
 
-  constructor(public readonly maxChars = 100_000) {}
+  constructor(public readonly maxBytes = 100_000) {
+    this.buf = Buffer.alloc(maxBytes);
+  }
 
-  append(data: string): void {
-    if (!data) return;
-    this.chunks.push(data);
-    this.chars += data.length;
+  append(data: Buffer): void {
+    const n = data.length;
+    if (n === 0) return;
     this._seq += 1;
-    while (this.chars > this.maxChars && this.chunks.length > 0) {
-      const evicted = this.chunks.shift()!;
-      this.chars -= evicted.length;
+
+    if (n >= this.maxBytes) {
+      data.copy(this.buf, 0, n - this.maxBytes);
+      this.head = 0;
+      this.filled = this.maxBytes;
+      return;
     }
+
+    // At most two copies: up to the end of the buffer, then wrapped to the front.
+    const first = Math.min(n, this.maxBytes - this.head);
+    data.copy(this.buf, this.head, 0, first);
+    if (first < n) data.copy(this.buf, 0, first);
+    this.head = (this.head + n) % this.maxBytes;
+    this.filled = Math.min(this.filled + n, this.maxBytes);
   }
 
   get seq(): number {
     return this._seq;
   }
 
+  /** The last `n` characters. Reads at most 4 bytes per character. */
   tail(n = 2000): string {
-    let remaining = n;
-    const out: string[] = [];
-    for (let i = this.chunks.length - 1; i >= 0 && remaining > 0; i--) {
-      const c = this.chunks[i];
-      if (c.length <= remaining) {
-        out.push(c);
-        remaining -= c.length;
-      } else {
-        out.push(c.slice(c.length - remaining));
-        remaining = 0;
-      }
-    }
-    return out.reverse().join("");
+    const len = Math.min(n * 4, this.filled);
+    const start = (this.head - len + this.maxBytes) % this.maxBytes;
+    const bytes =
+      start + len <= this.maxBytes
+        ? this.buf.subarray(start, start + len)
+        : Buffer.concat([this.buf.subarray(start), this.buf.subarray(0, this.head)]);
+    // The window (or an eviction) may start mid-character: skip up to three
+    // UTF-8 continuation bytes (10xxxxxx) so the decode starts on a boundary.
+    let skip = 0;
+    while (skip < 3 && skip < bytes.length && (bytes[skip] & 0xc0) === 0x80) skip++;
+    return bytes.subarray(skip).toString("utf-8").slice(-n);
+  }
+
+  /** Serialized processes report buffer stats, not the raw bytes. */
+  toJSON(): { bytes: number; seq: number } {
+    return { bytes: this.filled, seq: this._seq };
   }
 }
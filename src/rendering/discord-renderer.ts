@@ -1,9 +1,19 @@
 import type { Renderer } from "./types.js";
 import type { BlockEmitEvent, InputRequestKind, InputRequestOption, ExecutionMode } from "../stream/events.js";
+import { headLines } from "./truncate.js";
 
-const BARE_URL_RE = /(?<![<(])(https?:\/\/\S+)/g;
+const BARE_URL_RE = /(?<![<(])(https?:\/\/[^\s<>]+)/g;
+const WHITESPACE_RE = /\s/;
 
 export class DiscordRenderer implements Renderer {
+  /**
+   * Streaming re-renders the whole growing text on every delta. A URL can't
+   * span whitespace, so everything through the last whitespace of the previous
+   * input is kept already suppressed and only the tail is re-scanned.
+   */
+  private suppressedSrc = "";
+  private suppressedOut = "";
+
   renderStreaming(kind: "text" | "thinking", content: string): string {
     if (kind === "thinking") {
       const flat = content.replace(/\n/g, " ");
@@ -14,6 +24,8 @@ export class DiscordRenderer implements Renderer {
 
   renderEmit(event: BlockEmitEvent): string {
     switch (event.block.kind) {
+      case "text":
+        return this.renderStreaming("text", event.block.text);
       case "tool_use":
         return this.renderToolHeader(event.block.toolName, event.block.input);
       case "tool_result": {
@@ -44,11 +56,8 @@ export class DiscordRenderer implements Renderer {
   renderToolResult(content: string, isError: boolean): string {
     if (!content) return "";
     const prefix = isError ? "\u26A0\uFE0F " : "";
-    const lines = content.split("\n");
-    let truncated =
-      lines.length > 6
-        ? lines.slice(0, 6).join("\n") + `\n\u2026 (${lines.length - 6} more lines)`
-        : content;
+    const { head, omitted } = headLines(content, 6);
+    let truncated = omitted > 0 ? `${head}\n\u2026 (${omitted} more lines)` : content;
     if (truncated.length > 400) {
       truncated = truncated.slice(0, 400) + "\n\u2026 (truncated)";
     }
@@ -84,6 +93,32 @@ export class DiscordRenderer implements Renderer {
   }
 
   suppressEmbeds(text: string): string {
-    return text.replace(BARE_URL_RE, "<$1>");
+    if (!text.includes("http")) return text;
+
+    let src = "";
+    let out = "";
+    if (this.suppressedSrc && text.startsWith(this.suppressedSrc)) {
+      src = this.suppressedSrc;
+      out = this.suppressedOut;
+    }
+
+    // Cut just past the last whitespace: no match spans it, and a later
+    // text sharing this prefix has the same boundary.
+    const rest = text.slice(src.length);
+    const cut = lastWhitespace(rest) + 1;
+    if (cut > 0) {
+      out += rest.slice(0, cut).replace(BARE_URL_RE, "<$1>");
+      src += rest.slice(0, cut);
+    }
+    this.suppressedSrc = src;
+    this.suppressedOut = out;
+    return out + rest.slice(cut).replace(BARE_URL_RE, "<$1>");
+  }
+}
+
+function lastWhitespace(text: string): number {
+  for (let i = text.length - 1; i >= 0; i--) {
+    if (WHITESPACE_RE.test(text[i])) return i;
   }
+  return -1;
 }
@@ -0,0 +1,15 @@
+/**
+ * The first `max` lines of `content` and how many lines were left out.
+ * Walks newlines with `indexOf` instead of splitting the whole string, so
+ * a huge tool output costs one scan rather than an array of every line.
+ */
+export function headLines(content: string, max: number): { head: string; omitted: number } {
+  let end = -1;
+  for (let i = 0; i < max; i++) {
+    end = content.indexOf("\n", end + 1);
+    if (end < 0) return { head: content, omitted: 0 };
+  }
+  let omitted = 0;
+  for (let i = end; i >= 0; i = content.indexOf("\n", i + 1)) omitted++;
+  return { head: content.slice(0, end), omitted };
+}
@@ -4,6 +4,13 @@ export interface Renderer {
   /** Render accumulated content for a streaming text/thinking block. */
   renderStreaming(kind: "text" | "thinking", content: string): string;
 
+  /**
+   * True if rendering `kind` is the identity on appended text, i.e.
+   * `renderStreaming(kind, a + b) === renderStreaming(kind, a) + b`. The
+   * coordinator then appends each delta instead of re-rendering the block.
+   */
+  appendsDeltas?(kind: "text" | "thinking"): boolean;
+
   /** Render a one-shot emit event. */
   renderEmit(event: BlockEmitEvent): string;
 
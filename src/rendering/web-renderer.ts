@@ -1,5 +1,6 @@
 import type { Renderer } from "./types.js";
 import type { BlockEmitEvent, InputRequestKind, InputRequestOption, ExecutionMode } from "../stream/events.js";
+import { headLines } from "./truncate.js";
 
 /**
  * Plain-text renderer for the web voice adapter.
@@ -14,8 +15,14 @@ export class WebRenderer implements Renderer {
     return content;
   }
 
+  appendsDeltas(kind: "text" | "thinking"): boolean {
+    return kind === "text";
+  }
+
   renderEmit(event: BlockEmitEvent): string {
     switch (event.block.kind) {
+      case "text":
+        return this.renderStreaming("text", event.block.text);
       case "tool_use":
         return this.renderToolHeader(event.block.toolName, event.block.input);
       case "tool_result": {
@@ -46,11 +53,8 @@ export class WebRenderer implements Renderer {
   renderToolResult(content: string, isError: boolean): string {
     if (!content) return "";
     const prefix = isError ? "Warning: " : "";
-    const lines = content.split("\n");
-    let truncated =
-      lines.length > 6
-        ? lines.slice(0, 6).join("\n") + `\n... (${lines.length - 6} more lines)`
-        : content;
+    const { head, omitted } = headLines(content, 6);
+    let truncated = omitted > 0 ? `${head}\n... (${omitted} more lines)` : content;
     if (truncated.length > 400) {
       truncated = truncated.slice(0, 400) + "\n... (truncated)";
     }
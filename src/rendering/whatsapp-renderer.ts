@@ -13,8 +13,14 @@ export class WhatsAppRenderer implements Renderer {
     return content;
   }
 
+  appendsDeltas(kind: "text" | "thinking"): boolean {
+    return kind === "text";
+  }
+
   renderEmit(event: BlockEmitEvent): string {
     switch (event.block.kind) {
+      case "text":
+        return this.renderStreaming("text", event.block.text);
       case "tool_use":
         return this.renderToolHeader(event.block.toolName, event.block.input);
       case "tool_result": {
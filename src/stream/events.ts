@@ -43,6 +43,17 @@ export interface BlockCloseEvent extends BaseEvent {
   blockId: string;
 }
 
+// -- TEXT: a complete text block delivered in one piece --
+
+export interface TextEmitEvent extends BaseEvent {
+  type: "block_emit";
+  block: {
+    id: string;
+    kind: "text";
+    text: string;
+  };
+}
+
 // -- TOOL_USE: an AI model invoked a tool --
 
 export interface ToolUseEmitEvent extends BaseEvent {
@@ -100,6 +111,7 @@ export interface SystemEmitEvent extends BaseEvent {
 }
 
 export type BlockEmitEvent =
+  | TextEmitEvent
   | ToolUseEmitEvent
   | ToolResultEmitEvent
   | ErrorEmitEvent
@@ -3,10 +3,15 @@ import type { ChatPlatform, MessageRef } from "../platform/types.js";
 import type { Renderer } from "../rendering/types.js";
 import { logBotEvent } from "../core/logger.js";
 
+/** An identical tool call repeated within this window is not posted again. */
+const TOOL_HEADER_DEDUPE_MS = 500;
+
 interface OpenBlock {
   kind: "text" | "thinking";
   content: string;
   renderStart: number;
+  /** Leading chars of the block's render already sent in earlier messages. */
+  renderSkip: number;
 }
 
 /**
@@ -15,11 +20,17 @@ interface OpenBlock {
  */
 function unclosedCodeFence(text: string): string | null {
   let fence: string | null = null;
-  for (const line of text.split("\n")) {
-    const stripped = line.trim();
-    if (stripped.startsWith("```")) {
-      fence = fence === null ? stripped : null;
+  // Jump between "```" occurrences rather than splitting into lines; only a
+  // line that holds one is ever sliced.
+  let from = 0;
+  for (let pos = text.indexOf("```"); pos >= 0; pos = text.indexOf("```", from)) {
+    const lineStart = text.lastIndexOf("\n", pos) + 1;
+    let lineEnd = text.indexOf("\n", pos);
+    if (lineEnd < 0) lineEnd = text.length;
+    if (pos === lineStart || text.slice(lineStart, pos).trim() === "") {
+      fence = fence === null ? text.slice(pos, lineEnd).trim() : null;
     }
+    from = lineEnd + 1;
   }
   return fence;
 }
@@ -47,23 +58,59 @@ export class StreamCoordinator {
     let lastEdit = 0;
     let result: CompleteEvent | FatalErrorEvent | undefined;
     let lastTextContent: string | undefined;
+    // The previous event's tool call, if it was one — only back-to-back calls dedupe.
+    let lastToolCall: { key: string; at: number } | undefined;
 
     const openBlocks = new Map<string, OpenBlock>();
 
+    // The send/edit currently awaiting the platform, so the trailing edit
+    // and the event loop never post the same first message twice.
+    let inFlight: Promise<unknown> | undefined;
+    // Trailing edit: a rate-limited flush is retried once the window opens,
+    // instead of waiting for the next event to come along.
+    let trailingTimer: ReturnType<typeof setTimeout> | undefined;
+    const scheduleTrailing = () => {
+      if (trailingTimer !== undefined || !supportsEdit) return;
+      trailingTimer = setTimeout(() => {
+        trailingTimer = undefined;
+        renderStale();
+        // An overlong buffer needs split() first (cut point, fence repair);
+        // that belongs to the event loop, which splits on its next pass.
+        if (buffer.length > charLimit) return;
+        void flush().catch(() => {});
+      }, Math.max(0, lastEdit + editRateLimitMs - Date.now()));
+    };
+
     const flush = async (force = false) => {
+      while (inFlight) await inFlight.catch(() => {});
       if (!buffer) return;
       const now = Date.now();
-      if (!force && now - lastEdit < editRateLimitMs) return;
+      if (!force && now - lastEdit < editRateLimitMs) {
+        scheduleTrailing();
+        return;
+      }
 
       const text = buffer.slice(0, charLimit);
       if (!msg || !supportsEdit) {
-        msg = await this.platform.send(channelId, { text, parseMode: "markdown" });
+        const sending = this.platform.send(channelId, { text, parseMode: "markdown" });
+        inFlight = sending;
+        try {
+          msg = await sending;
+        } finally {
+          inFlight = undefined;
+        }
         // Discord auto-clears typing on message send; re-fire immediately to keep it visible
         if (this.platform.sendTyping && typingTimer !== undefined) {
           void this.platform.sendTyping(channelId).catch(() => {});
         }
       } else {
-        await this.platform.edit(msg, { text, parseMode: "markdown" });
+        const editing = this.platform.edit(msg, { text, parseMode: "markdown" });
+        inFlight = editing;
+        try {
+          await editing;
+        } finally {
+          inFlight = undefined;
+        }
       }
       lastEdit = Date.now();
     };
@@ -78,24 +125,20 @@ export class StreamCoordinator {
 
         await flush(true);
         msg = undefined;
-        buffer = fence ? `${fence}\n${overflow}` : overflow;
+        const prefix = fence ? `${fence}\n` : "";
+        buffer = prefix + overflow;
 
-        // After split, all open blocks' renderStart offsets pointed into the
-        // old (pre-split) buffer. Recalculate: any block whose renderStart
-        // was beyond the split point now starts at 0 (its rendered content
-        // was carried into the overflow). Blocks entirely before the split
-        // were already flushed and their content is gone.
+        // Rebase open blocks onto the new buffer: the first charLimit chars
+        // are gone and `prefix` was put in front. A block that began before
+        // the cut had part of its render sent already; remember how much so
+        // the next re-render doesn't repeat it.
         for (const ob of openBlocks.values()) {
-          // The block's rendered content was re-appended by the overflow,
-          // so its new start is wherever it landed in the new buffer.
-          // Since we're in a streaming block, the last render occupies
-          // buffer[renderStart..end]. After split, the new buffer IS the
-          // overflow — so the block starts at 0 (only one block streams
-          // at a time). For safety with multiple concurrent open blocks,
-          // search for the rendered content.
-          const rendered = this.renderer.renderStreaming(ob.kind, ob.content);
-          const idx = buffer.lastIndexOf(rendered);
-          ob.renderStart = idx >= 0 ? idx : buffer.length;
+          if (ob.renderStart >= charLimit) {
+            ob.renderStart += prefix.length - charLimit;
+          } else {
+            ob.renderSkip += charLimit - ob.renderStart;
+            ob.renderStart = prefix.length;
+          }
         }
       }
     };
@@ -109,6 +152,19 @@ export class StreamCoordinator {
       buffer = "";
     };
 
+    // A block whose full re-render was skipped because the next edit is
+    // rate-limited anyway. Rendered before anything else touches the buffer.
+    let staleBlock: OpenBlock | undefined;
+    const renderBlock = (ob: OpenBlock) => {
+      const rendered = this.renderer.renderStreaming(ob.kind, ob.content);
+      buffer = buffer.slice(0, ob.renderStart) + rendered.slice(ob.renderSkip);
+    };
+    const renderStale = () => {
+      if (!staleBlock) return;
+      renderBlock(staleBlock);
+      staleBlock = undefined;
+    };
+
     const lens = {
       contentLength: (id: string) => openBlocks.get(id)?.content.length ?? 0,
     };
@@ -123,11 +179,11 @@ export class StreamCoordinator {
       fire();
       typingTimer = setInterval(fire, 8_000);
     };
-    const stopTyping = async () => {
+    const stopTyping = async (clearedBySend = false) => {
       if (typingTimer !== undefined) {
         clearInterval(typingTimer);
         typingTimer = undefined;
-        await this.platform.stopTyping?.(channelId)?.catch(() => {});
+        if (!clearedBySend) await this.platform.stopTyping?.(channelId)?.catch(() => {});
       }
     };
     startTyping();
@@ -135,12 +191,17 @@ export class StreamCoordinator {
     try {
       for await (const ev of events) {
         logBotEvent(ev, lens);
+        if (staleBlock && !(ev.type === "block_delta" && openBlocks.get(ev.blockId) === staleBlock)) {
+          renderStale();
+        }
+        if (ev.type !== "block_emit" || ev.block.kind !== "tool_use") lastToolCall = undefined;
         switch (ev.type) {
           case "block_open":
             openBlocks.set(ev.block.id, {
               kind: ev.block.kind,
               content: "",
               renderStart: buffer.length,
+              renderSkip: 0,
             });
             break;
 
@@ -148,8 +209,18 @@ export class StreamCoordinator {
             const ob = openBlocks.get(ev.blockId);
             if (!ob) break;
             ob.content += ev.delta;
-            const rendered = this.renderer.renderStreaming(ob.kind, ob.content);
-            buffer = buffer.slice(0, ob.renderStart) + rendered;
+            if (this.renderer.appendsDeltas?.(ob.kind)) {
+              // Rendering is the identity on appends — O(delta) per event.
+              buffer += ev.delta;
+            } else if (Date.now() - lastEdit < editRateLimitMs) {
+              // flush() would skip this edit; render once when it's due.
+              staleBlock = ob;
+              scheduleTrailing();
+              break;
+            } else {
+              staleBlock = undefined;
+              renderBlock(ob);
+            }
             await split();
             await flush();
             break;
@@ -163,10 +234,23 @@ export class StreamCoordinator {
           }
 
           case "block_emit":
-            if (ev.block.kind === "tool_use") {
-              await finalize();
-              buffer = this.renderer.renderToolHeader(ev.block.toolName, ev.block.input);
-              await finalize();
+            if (ev.block.kind === "text") {
+              buffer += this.renderer.renderStreaming("text", ev.block.text);
+              lastTextContent = ev.block.text;
+              await split();
+              await flush();
+            } else if (ev.block.kind === "tool_use") {
+              // Keyed on the full input: the rendered header truncates it, so
+              // distinct calls can share a header.
+              const key = `${ev.block.toolName}\0${JSON.stringify(ev.block.input)}`;
+              const now = Date.now();
+              const repeat = lastToolCall?.key === key && now - lastToolCall.at < TOOL_HEADER_DEDUPE_MS;
+              lastToolCall = { key, at: now };
+              if (!repeat) {
+                await finalize();
+                buffer = this.renderer.renderToolHeader(ev.block.toolName, ev.block.input);
+                await finalize();
+              }
             } else if (ev.block.kind === "tool_result") {
               const text =
                 ev.block.content.format === "text"
@@ -215,15 +299,22 @@ export class StreamCoordinator {
       // Render the error inline so the adapter's catch block doesn't
       // produce a second, duplicate error message.
       const message = err instanceof Error ? err.message : String(err);
+      renderStale();
       buffer += this.renderer.renderFatalError(message);
     }
+    renderStale();
 
     if (result?.type === "complete" && this.renderer.renderFooter) {
       const footer = this.renderer.renderFooter(result.durationMs, result.costUsd);
       if (footer) buffer += `${buffer ? "\n" : ""}${footer}`;
     }
 
-    await stopTyping();
+    // When the last flush sends a new message (footer included), that send
+    // clears the indicator on platforms like Discord — skip the explicit stop.
+    clearTimeout(trailingTimer);
+    trailingTimer = undefined;
+    const finalSend = buffer !== "" && msg === undefined;
+    await stopTyping(finalSend && this.platform.constraints.sendClearsTyping);
     await finalize();
     return { event: result, lastText: lastTextContent };
   }
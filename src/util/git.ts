@@ -1,11 +1,20 @@
 import { execFile } from "node:child_process";
 
+/**
+ * Git roots by `cwd`. A directory's repo root doesn't move, so each lookup
+ * spawns `git` at most once; misses are not kept so a later `git init` is seen.
+ */
+const gitRootCache = new Map<string, Promise<string | null>>();
+
 /**
  * Walk up from `cwd` to find the git root directory.
  * Returns null if not inside a git repo.
  */
 export function findGitRoot(cwd: string): Promise<string | null> {
-  return new Promise((resolve) => {
+  const cached = gitRootCache.get(cwd);
+  if (cached) return cached;
+
+  const pending = new Promise<string | null>((resolve) => {
     execFile(
       "git",
       ["rev-parse", "--show-toplevel"],
@@ -16,4 +25,9 @@ export function findGitRoot(cwd: string): Promise<string | null> {
       },
     );
   });
+  gitRootCache.set(cwd, pending);
+  pending.then((root) => {
+    if (root === null) gitRootCache.delete(cwd);
+  });
+  return pending;
 }